@@ -1,10 +1,26 @@
+import heapq
+import io
 import json
+import operator
 import os
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    def _loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+
+    _DecodeError = orjson.JSONDecodeError
+except ImportError:
+    def _loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
+    _DecodeError = json.JSONDecodeError
+
 TestResult = Dict[str, Any]
 ComparisonDict = Dict[str, Any]
 
@@ -14,6 +30,9 @@ class AmmeterComparison:
 
     def __init__(self, results_path: str = "results/"):
         self.results_path = results_path
+        # Parsed results keyed by filename -> (mtime_ns, result), so repeat
+        # find_tests calls within one report only re-decode changed files
+        self._cache: Dict[str, Tuple[int, TestResult]] = {}
 
     def load_result(self, test_id: str) -> TestResult:
         """Load a single test result by ID"""
@@ -21,14 +40,22 @@ class AmmeterComparison:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Test result not found: {test_id}")
 
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return _loads(f.read())
+
+    def _load_many(self, test_ids: List[str]) -> List[TestResult]:
+        """Load several results concurrently - the reads are I/O-bound."""
+        if not test_ids:
+            return []
+        with ThreadPoolExecutor(max_workers=min(32, len(test_ids))) as ex:
+            return list(ex.map(self.load_result, test_ids))
 
     def find_tests(
         self,
         ammeter_type: Optional[str] = None,
         from_date: Optional[str] = None,
-        to_date: Optional[str] = None
+        to_date: Optional[str] = None,
+        limit: Optional[int] = None
     ) -> List[TestResult]:
         """
         Find tests matching criteria
@@ -37,43 +64,58 @@ class AmmeterComparison:
             ammeter_type: Filter by ammeter type (greenlee, entes, circutor)
             from_date: ISO format date string (e.g., "2026-01-26")
             to_date: ISO format date string
+            limit: Return only the newest N results
 
         Returns:
-            List of test result dictionaries
+            List of test result dictionaries, newest first
         """
-        results: List[TestResult] = []
-
-        # Get all JSON files
-        json_files = Path(self.results_path).glob("*.json")
-
-        for filepath in json_files:
-            try:
-                with open(filepath, 'r') as f:
-                    result = json.load(f)
-            except json.JSONDecodeError:
-                # Skip corrupted/incomplete JSON files
-                print(f"Warning: Skipping corrupted file: {filepath.name}")
-                continue
+        keyed: List[Tuple[str, TestResult]] = []
+        want = ammeter_type.lower() if ammeter_type else None
+
+        # Scan once with scandir - entry.stat() comes straight from the
+        # directory read, so the mtime cache check costs no extra syscalls
+        try:
+            entries = [e for e in os.scandir(self.results_path)
+                       if e.name.endswith('.json') and e.is_file()]
+        except FileNotFoundError:
+            return []
+
+        for entry in entries:
+            mtime_ns = entry.stat().st_mtime_ns
+            cached = self._cache.get(entry.name)
+            if cached is not None and cached[0] == mtime_ns:
+                result = cached[1]
+            else:
+                try:
+                    with open(entry.path, 'rb') as f:
+                        result = _loads(f.read())
+                except _DecodeError:
+                    # Skip corrupted/incomplete JSON files
+                    print(f"Warning: Skipping corrupted file: {entry.name}")
+                    continue
+                self._cache[entry.name] = (mtime_ns, result)
 
             # Apply filters
-            if ammeter_type and result['metadata']['ammeter_type'] != ammeter_type.lower():
+            metadata = result['metadata']
+            if want and metadata['ammeter_type'] != want:
                 continue
 
-            if from_date:
-                test_date = result['metadata']['timestamp'].split('T')[0]
-                if test_date < from_date:
-                    continue
-
-            if to_date:
-                test_date = result['metadata']['timestamp'].split('T')[0]
-                if test_date > to_date:
-                    continue
+            # ISO 8601 sorts lexicographically, so the YYYY-MM-DD prefix
+            # compares directly - no split/allocation per file
+            ts = metadata['timestamp']
+            if ((from_date and ts[:10] < from_date)
+                    or (to_date and ts[:10] > to_date)):
+                continue
 
-            results.append(result)
+            keyed.append((ts, result))
 
-        # Sort by timestamp (newest first)
-        results.sort(key=lambda x: x['metadata']['timestamp'], reverse=True)
-        return results
+        # Newest first; itemgetter keeps the per-comparison key lookup in C,
+        # and nlargest is O(N log K) when only the newest K are wanted
+        if limit is not None:
+            keyed = heapq.nlargest(limit, keyed, key=operator.itemgetter(0))
+        else:
+            keyed.sort(key=operator.itemgetter(0), reverse=True)
+        return [result for _, result in keyed]
 
     def compare_tests(self, test_ids: List[str]) -> ComparisonDict:
         """
@@ -91,9 +133,7 @@ class AmmeterComparison:
             'tests': tests
         }
 
-        for test_id in test_ids:
-            result: TestResult = self.load_result(test_id)
-
+        for test_id, result in zip(test_ids, self._load_many(test_ids)):
             tests.append({
                 'test_id': test_id,
                 'ammeter_type': result['metadata']['ammeter_type'],
@@ -107,57 +147,72 @@ class AmmeterComparison:
 
         return comparison
 
-    def compare_ammeter_types(self) -> ComparisonDict:
+    def compare_ammeter_types(
+        self, all_tests: Optional[List[TestResult]] = None
+    ) -> ComparisonDict:
         """
         Compare all ammeter types to determine relative accuracy
 
+        Args:
+            all_tests: Pre-loaded results to reuse; loaded here when omitted
+
         Returns:
             Dictionary with comparison metrics for each ammeter type
         """
-        all_tests: List[TestResult] = self.find_tests()
+        if all_tests is None:
+            all_tests = self.find_tests()
+
+        # One traversal: fill an N x 3 matrix of [mean, std_dev, outliers]
+        # and remember which rows belong to which type
+        matrix = np.empty((len(all_tests), 3), dtype=np.float64)
+        rows_by_type: Dict[str, List[int]] = {}
+        for row, test in enumerate(all_tests):
+            analysis = test['analysis']
+            matrix[row, 0] = analysis['mean']
+            matrix[row, 1] = analysis['std_dev']
+            matrix[row, 2] = analysis['outliers_count']
+            rows_by_type.setdefault(
+                test['metadata']['ammeter_type'], []).append(row)
+
+        # Aggregate each type with single C-level reductions over its rows,
+        # collecting the per-type averages into a G x 3 matrix so the
+        # reliability scores come from one vectorized expression at the end
+        types = list(rows_by_type)
+        averages = np.empty((len(types), 3), dtype=np.float64)
+        std_of_means = np.empty(len(types), dtype=np.float64)
+        for i, ammeter_type in enumerate(types):
+            group = matrix[rows_by_type[ammeter_type]]
+            averages[i] = group.mean(axis=0)
+            std_of_means[i] = group[:, 0].std()
+
+        scores = self._calculate_reliability(averages[:, 1], averages[:, 2])
 
-        # Group by ammeter type
-        by_type: Dict[str, List[TestResult]] = {}
-        for test in all_tests:
-            ammeter_type = test['metadata']['ammeter_type']
-            if ammeter_type not in by_type:
-                by_type[ammeter_type] = []
-            by_type[ammeter_type].append(test)
-
-        # Calculate aggregate statistics
         comparison: Dict[str, Dict[str, float | int]] = {}
-        for ammeter_type, tests in by_type.items():
-            means = [t['analysis']['mean'] for t in tests]
-            std_devs = [t['analysis']['std_dev'] for t in tests]
-            outlier_counts = [t['analysis']['outliers_count'] for t in tests]
-
+        for i, ammeter_type in enumerate(types):
             comparison[ammeter_type] = {
-                'test_count': len(tests),
-                'avg_mean': float(np.mean(means)),
-                'avg_std_dev': float(np.mean(std_devs)),
+                'test_count': len(rows_by_type[ammeter_type]),
+                'avg_mean': float(averages[i, 0]),
+                'avg_std_dev': float(averages[i, 1]),
                 # Consistency across tests
-                'std_dev_of_means': float(np.std(means)),
-                'avg_outliers': float(np.mean(outlier_counts)),
-                'reliability_score': self._calculate_reliability(std_devs, outlier_counts)
+                'std_dev_of_means': float(std_of_means[i]),
+                'avg_outliers': float(averages[i, 2]),
+                'reliability_score': float(scores[i])
             }
 
         return comparison
 
-    def _calculate_reliability(self, std_devs: List[float], outliers: List[int]) -> float:
+    def _calculate_reliability(self, avg_stds: np.ndarray,
+                               avg_outliers: np.ndarray) -> np.ndarray:
         """
-        Calculate reliability score (0-100)
+        Calculate reliability scores (0-100) for all types at once
         Lower std_dev and fewer outliers = higher reliability
         """
-        avg_std = np.mean(std_devs)
-        avg_outliers = np.mean(outliers)
-
         # Simple scoring: penalize high std dev and outliers
         # This is a simplified metric - could be more sophisticated
-        std_penalty = min(avg_std / 10, 50)  # Cap at 50 points
-        outlier_penalty = min(avg_outliers * 5, 50)  # Cap at 50 points
+        std_penalty = np.minimum(avg_stds / 10, 50)  # Cap at 50 points
+        outlier_penalty = np.minimum(avg_outliers * 5, 50)  # Cap at 50 points
 
-        score = 100 - std_penalty - outlier_penalty
-        return max(0, float(score))
+        return np.maximum(0, 100 - std_penalty - outlier_penalty)
 
     def generate_summary_report(self) -> str:
         """Generate a text summary of all test results"""
@@ -166,11 +221,12 @@ class AmmeterComparison:
         if not all_tests:
             return "No test results found."
 
-        report: List[str] = []
-        report.append("=" * 60)
-        report.append("AMMETER TEST RESULTS SUMMARY")
-        report.append("=" * 60)
-        report.append(f"\nTotal tests: {len(all_tests)}")
+        buf = io.StringIO()
+        buf.write(
+            f"{'=' * 60}\n"
+            f"AMMETER TEST RESULTS SUMMARY\n"
+            f"{'=' * 60}\n"
+            f"\nTotal tests: {len(all_tests)}\n")
 
         # Count by type
         by_type: Dict[str, int] = {}
@@ -178,36 +234,37 @@ class AmmeterComparison:
             ammeter_type = test['metadata']['ammeter_type']
             by_type[ammeter_type] = by_type.get(ammeter_type, 0) + 1
 
-        report.append(f"\nTests by ammeter type:")
+        buf.write("\nTests by ammeter type:\n")
         for ammeter_type, count in sorted(by_type.items()):
-            report.append(f"  {ammeter_type.upper()}: {count} tests")
+            buf.write(f"  {ammeter_type.upper()}: {count} tests\n")
 
-        # Ammeter comparison
-        report.append(f"\n{'-' * 60}")
-        report.append("AMMETER TYPE COMPARISON")
-        report.append('-' * 60)
+        # Ammeter comparison - one formatted block per type
+        buf.write(
+            f"\n{'-' * 60}\n"
+            f"AMMETER TYPE COMPARISON\n"
+            f"{'-' * 60}\n")
 
-        comparison = self.compare_ammeter_types()
+        comparison = self.compare_ammeter_types(all_tests)
         for ammeter_type, stats in sorted(comparison.items()):
-            report.append(f"\n{ammeter_type.upper()}:")
-            report.append(f"  Average Mean Current: {stats['avg_mean']:.2f}A")
-            report.append(f"  Average Std Dev: {stats['avg_std_dev']:.2f}A")
-            report.append(
-                f"  Consistency (std of means): {stats['std_dev_of_means']:.2f}A")
-            report.append(f"  Average Outliers: {stats['avg_outliers']:.1f}")
-            report.append(
-                f"  Reliability Score: {stats['reliability_score']:.1f}/100")
+            buf.write(
+                f"\n{ammeter_type.upper()}:\n"
+                f"  Average Mean Current: {stats['avg_mean']:.2f}A\n"
+                f"  Average Std Dev: {stats['avg_std_dev']:.2f}A\n"
+                f"  Consistency (std of means): {stats['std_dev_of_means']:.2f}A\n"
+                f"  Average Outliers: {stats['avg_outliers']:.1f}\n"
+                f"  Reliability Score: {stats['reliability_score']:.1f}/100\n")
 
         # Most reliable ammeter
         if comparison:
             best_ammeter = max(comparison.items(),
                                key=lambda x: x[1]['reliability_score'])
-            report.append(f"\n{'-' * 60}")
-            report.append(f"MOST RELIABLE: {best_ammeter[0].upper()} "
-                          f"(Score: {best_ammeter[1]['reliability_score']:.1f}/100)")
-            report.append('=' * 60)
+            buf.write(
+                f"\n{'-' * 60}\n"
+                f"MOST RELIABLE: {best_ammeter[0].upper()} "
+                f"(Score: {best_ammeter[1]['reliability_score']:.1f}/100)\n"
+                f"{'=' * 60}")
 
-        return '\n'.join(report)
+        return buf.getvalue()
 
 
 if __name__ == "__main__":
@@ -18,8 +18,13 @@ from test_qa.testing.data_collector import DataCollector
 from test_qa.utils.config import load_config
 
 
-def run_error_simulation_demo() -> None:
-    """Demonstrate error handling with simulated failures"""
+def run_error_simulation_demo(verbose: bool = True) -> None:
+    """Demonstrate error handling with simulated failures
+
+    Args:
+        verbose: Print each individual measurement; disable to keep the loop
+            free of per-iteration stdout formatting
+    """
 
     print("=" * 60)
     print("ERROR SIMULATION DEMONSTRATION")
@@ -61,11 +66,13 @@ def run_error_simulation_demo() -> None:
             try:
                 measurement = collector.get_single_measurement(ammeter_type)
                 successes += 1
-                print(f"  ✓ Measurement {i+1}: {measurement:.2f}A")
+                if verbose:
+                    print(f"  ✓ Measurement {i+1}: {measurement:.2f}A")
             except Exception as e:
                 failures += 1
-                print(
-                    f"  ✗ Measurement {i+1}: ERROR - {type(e).__name__}: {str(e)[:50]}")
+                if verbose:
+                    print(
+                        f"  ✗ Measurement {i+1}: ERROR - {type(e).__name__}: {str(e)[:50]}")
 
             time.sleep(0.05)  # Small delay between measurements
 
@@ -79,10 +86,10 @@ def run_error_simulation_demo() -> None:
     print('=' * 60)
 
     stats = error_sim.get_statistics()
-    print(f"Total measurement attempts: {stats['total_calls']}")
-    print(f"Errors injected: {stats['errors_injected']}")
-    print(f"Actual error rate: {stats['error_rate_actual']*100:.1f}%")
-    print(f"Configured error rate: {stats['error_rate_configured']*100:.1f}%")
+    print(f"Total measurement attempts: {stats.total_calls}")
+    print(f"Errors injected: {stats.errors_injected}")
+    print(f"Actual error rate: {stats.error_rate_actual*100:.1f}%")
+    print(f"Configured error rate: {stats.error_rate_configured*100:.1f}%")
 
     # Show error breakdown
     if collector.errors_encountered:
@@ -8,12 +8,10 @@ if sys.version_info < (3, 10):
     print("Please upgrade your Python version or use a compatible virtual environment.")
     sys.exit(1)
 
-import threading
-import time
-
 from test_qa.ammeters.circutor_ammeter import CircutorAmmeter
 from test_qa.ammeters.entes_ammeter import EntesAmmeter
 from test_qa.ammeters.greenlee_ammeter import GreenleeAmmeter
+from test_qa.ammeters.server import serve_all
 
 
 def run_greenlee_emulator():
@@ -32,24 +30,14 @@ def run_circutor_emulator():
 
 
 if __name__ == "__main__":
-    # Start each ammeter in a separate thread
-    threading.Thread(target=run_greenlee_emulator, daemon=True).start()
-    threading.Thread(target=run_entes_emulator, daemon=True).start()
-    threading.Thread(target=run_circutor_emulator, daemon=True).start()
-
-    # Wait for the servers to start
-    time.sleep(2)
-    print("\nAmmeter emulators are running. Press Ctrl+C to stop.\n")
-
-    # Optional: Test with a single measurement to verify connectivity
-    # from test_qa.ammeters.client import request_current_from_ammeter
-    # request_current_from_ammeter(5000, b'MEASURE_GREENLEE -get_measurement')
-    # request_current_from_ammeter(5001, b'MEASURE_ENTES -get_data')
-    # request_current_from_ammeter(5002, b'MEASURE_CIRCUTOR -get_measurement -current')
-
-    # Keep the program running to serve requests from the testing framework
+    # Serve all three emulators from a single selector-driven thread
+    print("\nStarting ammeter emulators. Press Ctrl+C to stop.\n")
+
     try:
-        while True:
-            time.sleep(1)
+        serve_all([
+            GreenleeAmmeter(5000),
+            EntesAmmeter(5001),
+            CircutorAmmeter(5002)
+        ])
     except KeyboardInterrupt:
         print("\nShutting down emulators...")
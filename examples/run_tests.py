@@ -9,20 +9,29 @@ if sys.version_info < (3, 10):
     print("Please upgrade your Python version or use a compatible virtual environment.")
     sys.exit(1)
 
+from concurrent.futures import ThreadPoolExecutor
+
 from test_qa.testing.test_framework import AmmeterTestFramework
 
 
-def main():
-    # יצירת מסגרת הבדיקות
-    framework = AmmeterTestFramework()
+def _run_one(ammeter_type: str) -> Dict[str, Any]:
+    # One framework per worker - run_test is I/O-bound on socket reads but
+    # the framework carries per-run state (test id, pooled sockets)
+    print(f"Testing {ammeter_type} ammeter...")
+    return AmmeterTestFramework().run_test(ammeter_type)
 
-    # הרצת בדיקות לכל סוגי האמפרמטרים
+
+def main():
+    # הרצת בדיקות לכל סוגי האמפרמטרים במקביל - כל אמפרמטר הוא שרת עצמאי
     ammeter_types = ["greenlee", "entes", "circutor"]
-    results: Dict[str, Dict[str, Any]] = {}
 
-    for ammeter_type in ammeter_types:
-        print(f"Testing {ammeter_type} ammeter...")
-        results[ammeter_type] = framework.run_test(ammeter_type)
+    with ThreadPoolExecutor(max_workers=len(ammeter_types)) as executor:
+        futures = {ammeter_type: executor.submit(_run_one, ammeter_type)
+                   for ammeter_type in ammeter_types}
+        results: Dict[str, Dict[str, Any]] = {
+            ammeter_type: future.result()
+            for ammeter_type, future in futures.items()
+        }
 
     # השוואת תוצאות
     for ammeter_type, result in results.items():
@@ -16,6 +16,10 @@ import subprocess
 import venv
 from pathlib import Path
 
+# Oldest pip version we consider current enough; the upgrade (and its PyPI
+# round-trip) is skipped when the venv's pip already meets it.
+MIN_PIP_VERSION = (23, 0)
+
 
 def check_python_version():
     """Verify Python 3.10+ is being used."""
@@ -65,8 +69,30 @@ def get_python_command(venv_path):
         return venv_path / "bin" / "python"
 
 
+def get_pip_version(pip_cmd):
+    """Return the installed pip version as a tuple, or None if unknown."""
+    try:
+        result = subprocess.run(
+            [str(pip_cmd), "--version"],
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        # Output looks like: "pip 24.0 from /path/... (python 3.11)"
+        version_str = result.stdout.split()[1]
+        return tuple(int(part) for part in version_str.split(".")[:2])
+    except (subprocess.CalledProcessError, IndexError, ValueError):
+        return None
+
+
 def upgrade_pip(pip_cmd):
-    """Upgrade pip to the latest version."""
+    """Upgrade pip if it is older than MIN_PIP_VERSION."""
+    installed = get_pip_version(pip_cmd)
+    if installed is not None and installed >= MIN_PIP_VERSION:
+        print(
+            f"✓ pip {'.'.join(map(str, installed))} is recent enough, skipping upgrade")
+        return True
+
     print("\nUpgrading pip...")
     try:
         subprocess.run(
@@ -4,10 +4,12 @@ from .base_ammeter import BaseAmmeter
 from .circutor_ammeter import CircutorAmmeter
 from .entes_ammeter import EntesAmmeter
 from .greenlee_ammeter import GreenleeAmmeter
+from .server import serve_all
 
 __all__ = [
     'BaseAmmeter',
     'CircutorAmmeter',
     'EntesAmmeter',
-    'GreenleeAmmeter'
+    'GreenleeAmmeter',
+    'serve_all'
 ]
@@ -1,51 +1,95 @@
-import socket
-import time
-import random
-from abc import ABC, abstractmethod
-
-NotImplementedErrorMsg = "Subclasses must implement this property."
-
-
-class BaseAmmeter(ABC):
-    def __init__(self, port: int):
-        self.port = port
-        # Seed the random number generator for each instance
-        random.seed(time.time())
-
-    def start_server(self):
-        """
-        Starts the server to listen for client requests.
-        The server will run indefinitely, handling one client request at a time.
-        """
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            # Allow socket reuse to prevent "Address already in use" errors
-            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            s.bind(('localhost', self.port))
-            s.listen()
-            print(f"{self.__class__.__name__} is running on port {self.port}")
-            while True:
-                conn, addr = s.accept()
-                with conn:
-                    print(f"Connected by {addr}")
-                    data = conn.recv(1024)
-                    if data == self.get_current_command:
-                        # Call the specific measure_current() method defined in subclasses
-                        current = self.measure_current()
-                        conn.sendall(str(current).encode('utf-8'))
-
-    @property
-    @abstractmethod
-    def get_current_command(self) -> bytes:
-        """
-        This property must be implemented by each subclass to provide the specific
-        command to get the current measurement.
-        """
-        raise NotImplementedError(NotImplementedErrorMsg)
-
-    @abstractmethod
-    def measure_current(self) -> float:
-        """
-        This method must be implemented by each subclass to provide the specific
-        logic for current measurement.
-        """
-        raise NotImplementedError(NotImplementedErrorMsg)
+import logging
+import socket
+import struct
+from abc import ABC, abstractmethod
+
+NotImplementedErrorMsg = "Subclasses must implement this property."
+
+logger = logging.getLogger(__name__)
+
+
+class BaseAmmeter(ABC):
+    def __init__(self, port: int):
+        self.port = port
+        # Resolve the command bytes once; the get_current_command property
+        # would otherwise allocate a fresh bytes object per request
+        self._cmd_bytes = self.get_current_command
+        self._batch_prefix = self._cmd_bytes + b' -n '
+
+    def bind(self) -> socket.socket:
+        """
+        Create, bind and listen on this ammeter's socket without entering an
+        accept loop, so callers can drive it themselves (e.g. via a selector).
+        """
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Allow socket reuse to prevent "Address already in use" errors
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        s.bind(('localhost', self.port))
+        s.listen()
+        logger.info("%s is running on port %s",
+                    self.__class__.__name__, self.port)
+        return s
+
+    def handle_request(self, data: bytes) -> bytes | None:
+        """
+        Handle one protocol request and return the reply bytes, or None if
+        the request is not recognized.
+        """
+        if data == self._cmd_bytes:
+            # Call the specific measure_current() method defined in subclasses
+            current = self.measure_current()
+            # 8-byte IEEE-754 reply - no str()/float() round-trip
+            return struct.pack('<d', current)
+        if data.startswith(self._batch_prefix):
+            # Batched request: "<command> -n <N>" returns N samples as a
+            # count-prefixed array of doubles, amortizing the round-trip
+            # over the whole batch
+            try:
+                count = int(data.rsplit(b' ', 1)[1])
+            except ValueError:
+                return None
+            if count <= 0:
+                return None
+            samples = [self.measure_current() for _ in range(count)]
+            return struct.pack(f'<I{count}d', count, *samples)
+        return None
+
+    def start_server(self):
+        """
+        Starts the server to listen for client requests.
+        The server will run indefinitely, handling one client connection at a
+        time and serving any number of requests per connection.
+        """
+        with self.bind() as s:
+            while True:
+                conn, addr = s.accept()
+                with conn:
+                    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    logger.debug("Connected by %s", addr)
+                    # Keep the connection open so the client can issue many
+                    # requests without reconnecting; an empty recv means the
+                    # client closed its end.
+                    while True:
+                        data = conn.recv(1024)
+                        if not data:
+                            break
+                        reply = self.handle_request(data)
+                        if reply is not None:
+                            conn.sendall(reply)
+
+    @property
+    @abstractmethod
+    def get_current_command(self) -> bytes:
+        """
+        This property must be implemented by each subclass to provide the specific
+        command to get the current measurement.
+        """
+        raise NotImplementedError(NotImplementedErrorMsg)
+
+    @abstractmethod
+    def measure_current(self) -> float:
+        """
+        This method must be implemented by each subclass to provide the specific
+        logic for current measurement.
+        """
+        raise NotImplementedError(NotImplementedErrorMsg)
@@ -1,6 +1,14 @@
+import logging
+import random
+
+import numpy as np
+
 from test_qa.ammeters.base_ammeter import BaseAmmeter
 
-from test_qa.utils.utils import generate_random_float
+logger = logging.getLogger(__name__)
+
+# Bound once at import - skips the generate_random_float wrapper frame per draw
+_uniform = random.uniform
 
 
 class CircutorAmmeter(BaseAmmeter):
@@ -11,13 +19,15 @@ class CircutorAmmeter(BaseAmmeter):
 
     def measure_current(self) -> float:
         num_samples = 10
-        time_step = generate_random_float(
-            0.001, 0.01)  # Time step (0.001s - 0.01s)
-        voltages = [generate_random_float(0.1, 1.0)
-                    for _ in range(num_samples)]  # Voltage values
-
-        print(
-            f"CIRCUTOR Ammeter - Voltages: {voltages}, Time Step: {time_step}s")
-        current = sum(v * time_step for v in voltages)
-        print(f"Current: {current}A")
+        time_step = _uniform(0.001, 0.01)  # Time step (0.001s - 0.01s)
+        # Voltage values - one vectorized draw instead of a Python-level loop
+        voltages = np.random.uniform(0.1, 1.0, num_samples)
+
+        # Guard the debug log - the array-to-list formatting is not free
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "CIRCUTOR Ammeter - Voltages: %s, Time Step: %ss",
+                voltages.tolist(), time_step)
+        current = float(time_step * voltages.sum())
+        logger.debug("Current: %sA", current)
         return current
@@ -1,5 +1,12 @@
+import logging
+import random
+
 from test_qa.ammeters.base_ammeter import BaseAmmeter
-from test_qa.utils.utils import generate_random_float
+
+logger = logging.getLogger(__name__)
+
+# Bound once at import - skips the generate_random_float wrapper frame per draw
+_uniform = random.uniform
 
 
 class EntesAmmeter(BaseAmmeter):
@@ -10,10 +17,11 @@ class EntesAmmeter(BaseAmmeter):
 
     def measure_current(self) -> float:
         # Magnetic field strength (0.01T - 0.1T)
-        magnetic_field = generate_random_float(0.01, 0.1)
-        calibration_factor = generate_random_float(
+        magnetic_field = _uniform(0.01, 0.1)
+        calibration_factor = _uniform(
             500, 2000)  # Calibration factor (500 - 2000)
         current = magnetic_field * calibration_factor
-        print(
-            f"ENTES Ammeter - Magnetic Field: {magnetic_field}T, Calibration Factor: {calibration_factor}, Current: {current}A")
+        logger.debug(
+            "ENTES Ammeter - Magnetic Field: %sT, Calibration Factor: %s, Current: %sA",
+            magnetic_field, calibration_factor, current)
         return current
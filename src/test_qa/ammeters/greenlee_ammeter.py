@@ -1,5 +1,12 @@
+import logging
+import random
+
 from test_qa.ammeters.base_ammeter import BaseAmmeter
-from test_qa.utils.utils import generate_random_float
+
+logger = logging.getLogger(__name__)
+
+# Bound once at import - skips the generate_random_float wrapper frame per draw
+_uniform = random.uniform
 
 
 class GreenleeAmmeter(BaseAmmeter):
@@ -9,10 +16,11 @@ class GreenleeAmmeter(BaseAmmeter):
         return b'MEASURE_GREENLEE -get_measurement'
 
     def measure_current(self) -> float:
-        voltage = generate_random_float(1.0, 10.0)  # Random voltage (1V - 10V)
+        voltage = _uniform(1.0, 10.0)  # Random voltage (1V - 10V)
         # Random resistance (0.1Ω - 100Ω)
-        resistance = generate_random_float(0.1, 100.0)
+        resistance = _uniform(0.1, 100.0)
         current = voltage / resistance
-        print(
-            f"Greenlee Ammeter - Voltage: {voltage}V, Resistance: {resistance}Ω, Current: {current}A")
+        logger.debug(
+            "Greenlee Ammeter - Voltage: %sV, Resistance: %sΩ, Current: %sA",
+            voltage, resistance, current)
         return current
@@ -0,0 +1,59 @@
+"""Single-threaded selector-based server for running several ammeter emulators."""
+import logging
+import selectors
+import socket
+from typing import List
+
+from .base_ammeter import BaseAmmeter
+
+logger = logging.getLogger(__name__)
+
+
+def serve_all(ammeters: List[BaseAmmeter]) -> None:
+    """
+    Serve all ammeter emulators from one thread.
+
+    Each ammeter's listening socket is registered with a selector; accepted
+    connections stay registered so clients can issue many requests per
+    connection. One thread multiplexing the sockets replaces a daemon thread
+    (and its stack) per emulator, which buys nothing under the GIL anyway.
+    """
+    selector = selectors.DefaultSelector()
+    listeners = [ammeter.bind() for ammeter in ammeters]
+
+    for ammeter, listener in zip(ammeters, listeners):
+        listener.setblocking(False)
+        selector.register(listener, selectors.EVENT_READ,
+                          (ammeter, True))  # True: listening socket
+
+    try:
+        while True:
+            for key, _ in selector.select():
+                ammeter, is_listener = key.data
+                sock: socket.socket = key.fileobj  # type: ignore[assignment]
+
+                if is_listener:
+                    conn, addr = sock.accept()
+                    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    conn.setblocking(False)
+                    logger.debug("Connected by %s", addr)
+                    selector.register(conn, selectors.EVENT_READ,
+                                      (ammeter, False))
+                    continue
+
+                try:
+                    data = sock.recv(1024)
+                except OSError:
+                    data = b''
+                if not data:
+                    selector.unregister(sock)
+                    sock.close()
+                    continue
+
+                reply = ammeter.handle_request(data)
+                if reply is not None:
+                    sock.sendall(reply)
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()  # type: ignore[union-attr]
+        selector.close()
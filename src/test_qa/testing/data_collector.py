@@ -1,117 +1,308 @@
-import time
-from typing import List, Dict, Optional, Any
-import threading
-import queue
-from .error_simulator import ErrorSimulator
-
-
-class DataCollector:
-    def __init__(self, config: Dict[str, Any], error_simulator: Optional[ErrorSimulator] = None) -> None:
-        self.config: Dict[str, Any] = config
-        self.measurement_queue: queue.Queue[float] = queue.Queue()
-        self.error_simulator: Optional[ErrorSimulator] = error_simulator
-        self.errors_encountered: List[Dict[str, Any]] = []
-
-    def collect_measurements(self, ammeter_type: str, test_id: str) -> List[Dict[str, Any]]:
-        """
-        איסוף מדידות מהאמפרמטר
-        """
-        measurements: List[Dict[str, Any]] = []
-        sampling_config: Dict[str, Any] = self.config["testing"]["sampling"]
-
-        # חישוב מרווח הזמן בין דגימות
-        interval: float = 1.0 / float(sampling_config["sampling_frequency_hz"])
-        total_measurements: int = int(sampling_config["measurements_count"])
-
-        # הפעלת תהליכון נפרד לדגימה
-        sampling_thread = threading.Thread(
-            target=self._sampling_worker,
-            args=(ammeter_type, interval, total_measurements)
-        )
-        sampling_thread.start()
-
-        # איסוף התוצאות
-        for _ in range(total_measurements):
-            measurement: float = self.measurement_queue.get()
-            measurements.append({
-                "timestamp": time.time(),
-                "value": measurement,
-                "test_id": test_id
-            })
-
-        sampling_thread.join()
-        return measurements
-
-    def _sampling_worker(self, ammeter_type: str, interval: float, total_measurements: int) -> None:
-        """
-        עובד שאוסף את המדידות בתהליכון נפרד
-        """
-        ammeter_config: Dict[str, Any] = self.config["ammeters"][ammeter_type]
-
-        for _ in range(total_measurements):
-            start_time: float = time.time()
-
-            # קבלת מדידה מהאמפרמטר
-            # כאן צריך להשתמש בקוד הקיים של האמפרמטרים
-            measurement: float = self._get_measurement(
-                ammeter_type, ammeter_config)
-
-            self.measurement_queue.put(measurement)
-
-            # המתנה עד לדגימה הבאה
-            elapsed: float = time.time() - start_time
-            if elapsed < interval:
-                time.sleep(interval - elapsed)
-
-    def _get_measurement(self, ammeter_type: str, config: Dict[str, Any]) -> float:
-        """
-        קבלת מדידה מהאמפרמטר הספציפי
-        """
-        import socket
-
-        port: int = int(config["port"])
-        command: bytes = str(config["command"]).encode('utf-8')
-
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(5)  # 5 second timeout
-                s.connect(('localhost', port))
-                s.sendall(command)
-                data: bytes = s.recv(1024)
-                if data:
-                    value: float = float(data.decode('utf-8'))
-
-                    # Apply error simulation if enabled
-                    if self.error_simulator:
-                        try:
-                            simulated_value: Any = self.error_simulator.inject_error(
-                                value)
-                            if simulated_value is None:
-                                raise ValueError(
-                                    "Empty response from error simulator")
-                            if not isinstance(simulated_value, (int, float)):
-                                raise ValueError(
-                                    f"Invalid data type from error simulator: {type(simulated_value)}")
-                            value = float(simulated_value)
-                        except (TimeoutError, ConnectionRefusedError, ValueError) as e:
-                            # Log error but allow retry mechanism to handle it
-                            error_info: Dict[str, Any] = {
-                                "ammeter_type": ammeter_type,
-                                "error_type": type(e).__name__,
-                                "error_message": str(e),
-                                "timestamp": time.time()
-                            }
-                            self.errors_encountered.append(error_info)
-                            raise
-
-                    return value
-                else:
-                    raise ValueError(f"No data received from {ammeter_type}")
-        except (socket.error, ValueError) as e:
-            raise RuntimeError(
-                f"Failed to get measurement from {ammeter_type}: {str(e)}")
-
-    def get_single_measurement(self, ammeter_type: str) -> float:
-        """Public helper for fetching one measurement from an ammeter."""
-        ammeter_config: Dict[str, Any] = self.config["ammeters"][ammeter_type]
-        return self._get_measurement(ammeter_type, ammeter_config)
+import asyncio
+import socket
+import struct
+import time
+from typing import List, Dict, Optional, Any
+
+import numpy as np
+
+from .error_simulator import ErrorSimulator
+
+# Prebuilt parsers for the fixed-width parts of the wire protocol - no
+# per-call format-string compilation
+_U32 = struct.Struct('<I')
+_F64 = struct.Struct('<d')
+
+
+class DataCollector:
+    # Upper bound on samples fetched per TCP round-trip
+    _MAX_BATCH: int = 100
+
+    def __init__(self, config: Dict[str, Any], error_simulator: Optional[ErrorSimulator] = None) -> None:
+        self.config: Dict[str, Any] = config
+        self.error_simulator: Optional[ErrorSimulator] = error_simulator
+        self.errors_encountered: List[Dict[str, Any]] = []
+        # Persistent connections to the ammeter emulators, keyed by ammeter type
+        self._sockets: Dict[str, socket.socket] = {}
+        # Reusable receive scratch - grown on demand, never shrunk, so the
+        # steady-state sampling path allocates nothing per reply
+        self._recv_buf: bytearray = bytearray(4 + self._MAX_BATCH * 8)
+        # Per-ammeter (port, command bytes, timeout, binary flag) flattened
+        # out of the nested config once, with values already at the right
+        # types, so no chained dict lookups or conversions remain on the
+        # sampling path. response_format "float64le" (the default) selects
+        # the binary protocol; "ascii" keeps a text fallback for hardware
+        # that replies with decimal strings
+        self._resolved: Dict[str, tuple[int, bytes, float, bool]] = {
+            ammeter_type: (
+                int(cfg["port"]),
+                str(cfg["command"]).encode('utf-8'),
+                float(cfg.get("socket_timeout_ms", 250)) / 1000.0,
+                cfg.get("response_format", "float64le") == "float64le"
+            )
+            for ammeter_type, cfg in config["ammeters"].items()
+        }
+
+    def _get_or_connect(self, ammeter_type: str, port: int, timeout: float) -> socket.socket:
+        """
+        Return the pooled connection for an ammeter, connecting lazily on first use.
+        """
+        s: Optional[socket.socket] = self._sockets.get(ammeter_type)
+        if s is None:
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Disable Nagle's algorithm - the protocol is tiny request/response
+            # pairs on loopback, so coalescing only adds delayed-ACK stalls
+            s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            s.settimeout(timeout)
+            s.connect(('localhost', port))
+            self._sockets[ammeter_type] = s
+        return s
+
+    def _drop_socket(self, ammeter_type: str) -> None:
+        """Close and forget a pooled connection (e.g. after a socket error)."""
+        s: Optional[socket.socket] = self._sockets.pop(ammeter_type, None)
+        if s is not None:
+            try:
+                s.close()
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        for ammeter_type in list(self._sockets):
+            self._drop_socket(ammeter_type)
+
+    def collect_measurements(self, ammeter_type: str) -> Dict[str, Any]:
+        """
+        איסוף מדידות מהאמפרמטר
+
+        Returns a structure-of-arrays record: preallocated float64 arrays for
+        values and timestamps, instead of one dict per sample. The run is
+        identified by the test_id in the surrounding metadata.
+        """
+        sampling_config: Dict[str, Any] = self.config["testing"]["sampling"]
+        port, command, timeout, binary = self._resolved[ammeter_type]
+
+        # חישוב מרווח הזמן בין דגימות
+        interval: float = 1.0 / float(sampling_config["sampling_frequency_hz"])
+        total_measurements: int = int(sampling_config["measurements_count"])
+
+        values: np.ndarray = np.empty(total_measurements, dtype=np.float64)
+        timestamps: np.ndarray = np.empty(total_measurements, dtype=np.float64)
+
+        # דגימה באצוות - סבב TCP אחד לכל אצווה במקום לכל דגימה
+        index: int = 0
+        remaining: int = total_measurements
+        next_tick: float = time.perf_counter()
+        while remaining > 0:
+            batch_size: int = min(remaining, self._MAX_BATCH)
+            batch: List[float] = self._get_measurements_batch(
+                ammeter_type, port, command, timeout, batch_size, binary)
+            now: float = time.time()
+            values[index:index + batch_size] = batch
+            timestamps[index:index + batch_size] = now
+            index += batch_size
+            remaining -= batch_size
+
+            # המתנה עד לאצווה הבאה - שומר על קצב הדגימה הממוצע
+            if remaining > 0:
+                next_tick += batch_size * interval
+                sleep_for: float = next_tick - time.perf_counter()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+
+        return {"values": values, "timestamps": timestamps}
+
+    async def collect_measurements_async(self, ammeter_type: str) -> Dict[str, Any]:
+        """
+        איסוף מדידות מאמפרמטר אחד באופן אסינכרוני
+        """
+        sampling_config: Dict[str, Any] = self.config["testing"]["sampling"]
+        port, command, timeout, binary = self._resolved[ammeter_type]
+
+        interval: float = 1.0 / float(sampling_config["sampling_frequency_hz"])
+        total_measurements: int = int(sampling_config["measurements_count"])
+
+        values: np.ndarray = np.empty(total_measurements, dtype=np.float64)
+        timestamps: np.ndarray = np.empty(total_measurements, dtype=np.float64)
+
+        reader, writer = await asyncio.open_connection('localhost', port)
+        sock: Optional[socket.socket] = writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        try:
+            next_tick: float = time.perf_counter()
+            for index in range(total_measurements):
+                values[index] = await self._get_measurement_async(
+                    ammeter_type, reader, writer, command, timeout, binary)
+                timestamps[index] = time.time()
+
+                next_tick += interval
+                sleep_for: float = next_tick - time.perf_counter()
+                if sleep_for > 0:
+                    await asyncio.sleep(sleep_for)
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+        return {"values": values, "timestamps": timestamps}
+
+    async def collect_all(self, ammeter_types: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        איסוף מדידות מכל האמפרמטרים במקביל
+        """
+        results: List[Dict[str, Any]] = await asyncio.gather(
+            *(self.collect_measurements_async(ammeter_type)
+              for ammeter_type in ammeter_types)
+        )
+        return dict(zip(ammeter_types, results))
+
+    async def _get_measurement_async(
+        self,
+        ammeter_type: str,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        command: bytes,
+        timeout: float,
+        binary: bool = True
+    ) -> float:
+        """
+        קבלת מדידה בודדת על גבי חיבור אסינכרוני פתוח
+        """
+        try:
+            writer.write(command)
+            await writer.drain()
+            if binary:
+                data: bytes = await asyncio.wait_for(
+                    reader.readexactly(8), timeout=timeout)
+                value: float = _F64.unpack_from(data)[0]
+            else:
+                data = await asyncio.wait_for(
+                    reader.read(64), timeout=timeout)
+                if not data:
+                    raise ValueError("Connection closed mid-response")
+                value = float(data.decode('ascii'))
+            return self._apply_error_simulation(ammeter_type, value)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError,
+                socket.error, ValueError, struct.error) as e:
+            raise RuntimeError(
+                f"Failed to get measurement from {ammeter_type}: {str(e)}")
+
+    def _get_measurements_batch(self, ammeter_type: str, port: int, command: bytes,
+                                timeout: float, count: int,
+                                binary: bool = True) -> List[float]:
+        """
+        קבלת אצוות מדידות בסבב TCP אחד
+        """
+        if not binary:
+            # The batched reply only exists in the binary protocol; ASCII
+            # ammeters are sampled one round-trip at a time
+            return [self._get_measurement(ammeter_type, port, command,
+                                          timeout, binary=False)
+                    for _ in range(count)]
+
+        batch_command: bytes = command + b' -n ' + str(count).encode('ascii')
+
+        try:
+            s: socket.socket = self._get_or_connect(ammeter_type, port, timeout)
+            try:
+                s.sendall(batch_command)
+                header: memoryview = self._recv_exact(s, 4)
+            except socket.error:
+                # Broken pipe / stale connection - reconnect and retry once
+                self._drop_socket(ammeter_type)
+                s = self._get_or_connect(ammeter_type, port, timeout)
+                s.sendall(batch_command)
+                header = self._recv_exact(s, 4)
+            returned: int = _U32.unpack_from(header)[0]
+            payload: memoryview = self._recv_exact(s, returned * 8)
+            values = struct.unpack(f'<{returned}d', payload)
+            return [self._apply_error_simulation(ammeter_type, value)
+                    for value in values]
+        except (socket.error, ValueError, struct.error) as e:
+            raise RuntimeError(
+                f"Failed to get measurement from {ammeter_type}: {str(e)}")
+
+    def _recv_exact(self, s: socket.socket, nbytes: int) -> memoryview:
+        """
+        Read exactly nbytes from the socket (TCP may fragment replies).
+
+        Returns a memoryview over the shared scratch buffer, trimmed to the
+        reply length - callers must unpack it before the next receive.
+        """
+        if len(self._recv_buf) < nbytes:
+            self._recv_buf = bytearray(nbytes)
+        view = memoryview(self._recv_buf)
+        received: int = 0
+        while received < nbytes:
+            chunk: int = s.recv_into(view[received:nbytes])
+            if chunk == 0:
+                raise ValueError("Connection closed mid-response")
+            received += chunk
+        return view[:nbytes]
+
+    def _get_measurement(self, ammeter_type: str, port: int, command: bytes,
+                         timeout: float, binary: bool = True) -> float:
+        """
+        קבלת מדידה מהאמפרמטר הספציפי
+        """
+        try:
+            s: socket.socket = self._get_or_connect(ammeter_type, port, timeout)
+            try:
+                s.sendall(command)
+                value: float = self._read_reply(s, binary)
+            except (socket.error, ValueError):
+                # Broken pipe / stale connection - reconnect and retry once
+                self._drop_socket(ammeter_type)
+                s = self._get_or_connect(ammeter_type, port, timeout)
+                s.sendall(command)
+                value = self._read_reply(s, binary)
+            return self._apply_error_simulation(ammeter_type, value)
+        except (socket.error, ValueError, struct.error) as e:
+            raise RuntimeError(
+                f"Failed to get measurement from {ammeter_type}: {str(e)}")
+
+    def _read_reply(self, s: socket.socket, binary: bool) -> float:
+        """Parse one measurement reply from the socket."""
+        if binary:
+            return _F64.unpack_from(self._recv_exact(s, 8))[0]
+        # ASCII fallback - one recv into the shared scratch, trimmed to the
+        # actual reply length before parsing
+        nread: int = s.recv_into(memoryview(self._recv_buf))
+        if nread == 0:
+            raise ValueError("Connection closed mid-response")
+        return float(self._recv_buf[:nread].decode('ascii'))
+
+    def _apply_error_simulation(self, ammeter_type: str, value: float) -> float:
+        """
+        הזרקת שגיאות מדומות לערך המדידה (אם מופעל)
+        """
+        if not self.error_simulator:
+            return value
+
+        try:
+            simulated_value: Any = self.error_simulator.inject_error(value)
+            if simulated_value is None:
+                raise ValueError(
+                    "Empty response from error simulator")
+            if not isinstance(simulated_value, (int, float)):
+                raise ValueError(
+                    f"Invalid data type from error simulator: {type(simulated_value)}")
+            return float(simulated_value)
+        except (TimeoutError, ConnectionRefusedError, ValueError) as e:
+            # Log error but allow retry mechanism to handle it
+            error_info: Dict[str, Any] = {
+                "ammeter_type": ammeter_type,
+                "error_type": type(e).__name__,
+                "error_message": str(e),
+                "timestamp": time.time()
+            }
+            self.errors_encountered.append(error_info)
+            raise
+
+    def get_single_measurement(self, ammeter_type: str) -> float:
+        """Public helper for fetching one measurement from an ammeter."""
+        port, command, timeout, binary = self._resolved[ammeter_type]
+        return self._get_measurement(ammeter_type, port, command, timeout, binary)
@@ -1,5 +1,7 @@
+import bisect
 import random
-from typing import Optional, Dict, Any
+from collections import namedtuple
+from typing import Callable, Optional, Dict, Any, List
 from enum import Enum
 
 
@@ -12,6 +14,44 @@ class ErrorType(Enum):
     INVALID_VALUE = "invalid_value"
 
 
+# Statistics snapshot - derived on demand so the hot path only keeps counters
+_Stats = namedtuple(
+    "_Stats",
+    "total_calls errors_injected error_rate_actual error_rate_configured enabled")
+
+
+def _raise_timeout() -> Any:
+    raise TimeoutError("Simulated measurement timeout")
+
+
+def _raise_connection_refused() -> Any:
+    raise ConnectionRefusedError("Simulated connection refused")
+
+
+# Built once at import instead of per ErrorSimulator construction
+_DEFAULT_ERROR_CONFIG: Dict[str, Any] = {
+    "enabled": False,
+    "error_rate": 0.1,
+    "error_types": {
+        "timeout": 0.3,
+        "corrupt_data": 0.4,
+        "connection_refused": 0.1,
+        "empty_response": 0.1,
+        "invalid_value": 0.1
+    }
+}
+
+# Outcome per error type - one dict lookup plus one call on the hot path
+# instead of walking an if/elif ladder over the enum members
+_ERROR_ACTIONS: Dict[ErrorType, Callable[[], Any]] = {
+    ErrorType.TIMEOUT: _raise_timeout,
+    ErrorType.CONNECTION_REFUSED: _raise_connection_refused,
+    ErrorType.EMPTY_RESPONSE: lambda: None,
+    ErrorType.CORRUPT_DATA: lambda: "CORRUPT_DATA_NOT_A_FLOAT",  # Invalid data type
+    ErrorType.INVALID_VALUE: lambda: -999.99,  # Out-of-range value
+}
+
+
 class ErrorSimulator:
     """
     Simulates various measurement errors for testing error handling capabilities
@@ -36,17 +76,7 @@ class ErrorSimulator:
                 }
         """
         if config is None:
-            config = {
-                "enabled": False,
-                "error_rate": 0.1,
-                "error_types": {
-                    "timeout": 0.3,
-                    "corrupt_data": 0.4,
-                    "connection_refused": 0.1,
-                    "empty_response": 0.1,
-                    "invalid_value": 0.1
-                }
-            }
+            config = _DEFAULT_ERROR_CONFIG
 
         self.enabled = config.get("enabled", False)
         self.error_rate = config.get("error_rate", 0.1)
@@ -54,33 +84,30 @@ class ErrorSimulator:
         self.error_count = 0
         self.total_calls = 0
 
-    def should_inject_error(self) -> bool:
-        """Determine if an error should be injected based on error_rate"""
-        self.total_calls += 1
-
-        if not self.enabled:
-            return False
-
-        return random.random() < self.error_rate
-
-    def get_error_type(self) -> ErrorType:
-        """Select which type of error to inject based on configured probabilities"""
-        error_weights: list[float] = []
-        error_values: list[ErrorType] = []
+        # Per-instance generator so error injection never touches the global RNG
+        self._rng = random.Random()
 
+        # Precompute the cumulative (normalized) weight table once so
+        # get_error_type is a single random draw plus a binary search
+        self._error_values: List[ErrorType] = []
+        cumulative: List[float] = []
+        total_weight = 0.0
         for error_name, probability in self.error_types.items():
             try:
-                error_values.append(ErrorType[error_name.upper()])
-                error_weights.append(probability)
+                error_value = ErrorType[error_name.upper()]
             except KeyError:
                 continue
-
-        # Normalize weights to sum to 1.0
-        total_weight = sum(error_weights)
+            self._error_values.append(error_value)
+            total_weight += probability
+            cumulative.append(total_weight)
         if total_weight > 0:
-            error_weights = [w / total_weight for w in error_weights]
+            cumulative = [w / total_weight for w in cumulative]
+        self._error_cum: List[float] = cumulative
 
-        return random.choices(error_values, weights=error_weights)[0]
+    def get_error_type(self) -> ErrorType:
+        """Select which type of error to inject based on configured probabilities"""
+        index = bisect.bisect_left(self._error_cum, self._rng.random())
+        return self._error_values[min(index, len(self._error_values) - 1)]
 
     def inject_error(self, data: Any) -> Any:
         """
@@ -97,37 +124,23 @@ class ErrorSimulator:
             ConnectionRefusedError: Simulates connection failure
             ValueError: Simulates invalid/corrupt data
         """
-        if not self.should_inject_error():
+        # Common case first: a disabled simulator costs one attribute load
+        if not self.enabled:
             return data
 
-        self.error_count += 1
-        error_type = self.get_error_type()
-
-        if error_type == ErrorType.TIMEOUT:
-            raise TimeoutError("Simulated measurement timeout")
-
-        elif error_type == ErrorType.CONNECTION_REFUSED:
-            raise ConnectionRefusedError("Simulated connection refused")
-
-        elif error_type == ErrorType.EMPTY_RESPONSE:
-            return None
-
-        elif error_type == ErrorType.CORRUPT_DATA:
-            # Return invalid data type
-            return "CORRUPT_DATA_NOT_A_FLOAT"
-
-        elif error_type == ErrorType.INVALID_VALUE:
-            # Return out-of-range value
-            return -999.99
+        self.total_calls += 1
+        if self._rng.random() >= self.error_rate:
+            return data
 
-        return data
+        self.error_count += 1
+        return _ERROR_ACTIONS[self.get_error_type()]()
 
-    def get_statistics(self) -> Dict[str, Any]:
+    def get_statistics(self) -> _Stats:
         """Get error injection statistics"""
-        return {
-            "total_calls": self.total_calls,
-            "errors_injected": self.error_count,
-            "error_rate_actual": self.error_count / self.total_calls if self.total_calls > 0 else 0,
-            "error_rate_configured": self.error_rate,
-            "enabled": self.enabled
-        }
+        return _Stats(
+            total_calls=self.total_calls,
+            errors_injected=self.error_count,
+            error_rate_actual=self.error_count / self.total_calls if self.total_calls > 0 else 0,
+            error_rate_configured=self.error_rate,
+            enabled=self.enabled
+        )
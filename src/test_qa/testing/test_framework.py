@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 from ..utils.config import load_config
 from .data_collector import DataCollector
@@ -14,22 +14,33 @@ class AmmeterTestFramework:
         self.data_collector: DataCollector = DataCollector(self.config)
         self.result_analyzer: ResultAnalyzer = ResultAnalyzer(self.config)
         self.visualizer: DataVisualizer = DataVisualizer(self.config)
-        self.test_id: str = str(uuid.uuid4())
+        # Invariants hoisted out of run_test - the nested config lookups
+        # only happen once per framework, not once per test
+        sampling: Dict[str, Any] = self.config["testing"]["sampling"]
+        self._meta_template: Dict[str, Any] = {
+            "test_duration": sampling["total_duration_seconds"],
+            "sampling_frequency": sampling["sampling_frequency_hz"]
+        }
+        self._visualization_enabled: bool = (
+            self.config["analysis"]["visualization"]["enabled"])
+        self._valid_types: frozenset[str] = frozenset(self.config["ammeters"])
 
     def run_test(self, ammeter_type: str) -> Dict[str, Any]:
         """
         הרצת בדיקה מלאה על אמפרמטר ספציפי
         """
         # Validate ammeter type before starting
-        valid_types: List[str] = list(self.config["ammeters"].keys())
-        if ammeter_type.lower() not in valid_types:
+        if ammeter_type.lower() not in self._valid_types:
             raise ValueError(
-                f"Invalid ammeter type: {ammeter_type}. Must be one of {valid_types}")
+                f"Invalid ammeter type: {ammeter_type}. "
+                f"Must be one of {sorted(self._valid_types)}")
+
+        # מזהה חדש לכל הרצה - אחרת כל הבדיקות נשמרות לאותו קובץ
+        test_id: str = str(uuid.uuid4())
 
         # איסוף נתונים
-        measurements: List[Dict[str, Any]] = self.data_collector.collect_measurements(
-            ammeter_type=ammeter_type,
-            test_id=self.test_id
+        measurements: Dict[str, Any] = self.data_collector.collect_measurements(
+            ammeter_type=ammeter_type
         )
 
         # ניתוח התוצאות
@@ -37,20 +48,19 @@ class AmmeterTestFramework:
             measurements)
 
         # יצירת ויזואליזציה
-        if self.config["analysis"]["visualization"]["enabled"]:
+        if self._visualization_enabled:
             self.visualizer.create_visualizations(
                 measurements,
-                test_id=self.test_id,
+                test_id=test_id,
                 ammeter_type=ammeter_type
             )
 
-        # הכנת המטא-דאטה
+        # הכנת המטא-דאטה - רק השדות המשתנים מתווספים לתבנית הקבועה
         metadata: Dict[str, Any] = {
-            "test_id": self.test_id,
+            **self._meta_template,
+            "test_id": test_id,
             "timestamp": datetime.now().isoformat(),
-            "ammeter_type": ammeter_type,
-            "test_duration": self.config["testing"]["sampling"]["total_duration_seconds"],
-            "sampling_frequency": self.config["testing"]["sampling"]["sampling_frequency_hz"]
+            "ammeter_type": ammeter_type
         }
 
         # שמירת התוצאות
@@ -67,12 +77,32 @@ class AmmeterTestFramework:
         """
         שמירת תוצאות הבדיקה
         """
-        import json
         import os
 
         save_path: str = self.config["result_management"]["save_path"]
         filename: str = f"{save_path}/{results['metadata']['test_id']}.json"
-
         os.makedirs(save_path, exist_ok=True)
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=4)
+
+        try:
+            import orjson  # type: ignore[import-not-found]
+
+            # Serializes the measurement ndarrays directly - no per-element
+            # float conversion - and writes the whole payload in one syscall
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    results,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        except ImportError:
+            import json
+
+            # Stdlib fallback - arrays become plain lists only at write time
+            measurements: Dict[str, Any] = results["measurements"]
+            serializable: Dict[str, Any] = {
+                **results,
+                "measurements": {
+                    "values": measurements["values"].tolist(),
+                    "timestamps": measurements["timestamps"].tolist()
+                }
+            }
+            with open(filename, 'w') as f:
+                json.dump(serializable, f, indent=4)
@@ -43,9 +43,9 @@ class TestAmmeterFramework(unittest.TestCase):
         self.assertIn("analysis", results)
 
         # בדיקת טווח המדידות
-        for measurement in results["measurements"]:
-            self.assertGreater(measurement["value"], 0)
-            self.assertLess(measurement["value"], 100)
+        for value in results["measurements"]["values"]:
+            self.assertGreater(value, 0)
+            self.assertLess(value, 100)
 
     def test_entes_measurements(self):
         """